@@ -1,122 +1,285 @@
-#!/usr/bin/env python3
-"""
-demo_data.py
-
-Generates and serves a large, realistic demo email dataset for the Email Filter
-and Dashboard application. Data is synthesized deterministically for repeatable
-results and covers a broad date range so UI filtering can be exercised.
-"""
-
-from __future__ import annotations
-
-from datetime import datetime, timedelta
-from typing import List, Dict
-import random
-
-
-_CACHED_DATASET: List[Dict] = []
-
-
-def _generate_large_dataset() -> List[Dict]:
-    """Create a large, realistic dataset (~3,000 emails) spanning 180 days.
-
-    Returns a list of dicts with keys: name, email, subject, body, date.
-    """
-    senders = [
-        ("Himanshu", "himanshu@example.com"),
-        ("Sakher", "sakher@company.com"),
-        ("Mayank", "mayank@techcorp.com"),
-        ("sandhya", "sandhya@startup.io"),
-        ("vinod", "vinod@consulting.com"),
-        ("Priya Nair", "priya.nair@acme.co"),
-        ("aviral", "aviral@supplychain.io"),
-        ("Aisha Khan", "aisha.khan@fintech.app"),
-        ("Nora", "nora@retailhub.com"),
-        ("Lucky", "lucky@hardware.cn"),
-        ("shobhit", "shobhit@healthcare.org"),
-        ("chavi", "chavi@edutech.edu"),
-    ]
-
-    subjects = [
-        "Meeting Reminder",
-        "Project Update",
-        "Invoice Attached",
-        "Release Notes",
-        "Action Required",
-        "Budget Approval",
-        "Welcome Aboard",
-        "Weekly Report",
-        "Customer Feedback",
-        "Outage Postmortem",
-        "Contract Review",
-        "Security Notice",
-    ]
-
-    body_snippets = [
-        "Please find the details in the attached document. Let me know if you have questions.",
-        "We are on track against the current milestones and expect to hit the deadline.",
-        "This is a reminder for the meeting scheduled tomorrow at 2 PM.",
-        "The latest build includes performance improvements and bug fixes across modules.",
-        "Kindly review and approve at your earliest convenience.",
-        "Thanks for your prompt attention to this matter.",
-        "Summarizing this week’s progress and next steps for the team.",
-        "Please review the notes and provide your feedback by EOD.",
-        "We observed an increase in engagement week over week.",
-        "Action items are listed at the end of this message.",
-    ]
-
-    # Seed for deterministic output
-    random.seed(12345)
-
-    today = datetime.today().replace(hour=0, minute=0, second=0, microsecond=0)
-    start_range = today - timedelta(days=179)
-    end_range = today
-
-    dataset: List[Dict] = []
-    current = start_range
-    while current <= end_range:
-        emails_today = random.randint(5, 30)  # denser data
-        for _ in range(emails_today):
-            sender_name, sender_email = random.choice(senders)
-            subject = f"{random.choice(subjects)} - {current.strftime('%b %d, %Y')}"
-            body = (
-                random.choice(body_snippets) + " " +
-                random.choice(body_snippets) + " " +
-                random.choice(body_snippets)
-            )
-            # Random time during the day
-            dt = current + timedelta(
-                hours=random.randint(0, 23),
-                minutes=random.randint(0, 59),
-                seconds=random.randint(0, 59),
-            )
-            dataset.append({
-                'name': sender_name,
-                'email': sender_email,
-                'subject': subject,
-                'body': body,
-                'date': dt,
-            })
-        current += timedelta(days=1)
-
-    # Sort by date descending to show latest first
-    dataset.sort(key=lambda x: x['date'], reverse=True)
-    return dataset
-
-
-def get_demo_dataset() -> List[Dict]:
-    """Return the cached large dataset, generating it on first use."""
-    global _CACHED_DATASET
-    if not _CACHED_DATASET:
-        _CACHED_DATASET = _generate_large_dataset()
-    return _CACHED_DATASET
-
-
-def load_demo_emails_between(start_date: datetime, end_date: datetime) -> List[Dict]:
-    """Filter the large dataset between start_date and end_date (inclusive)."""
-    data = get_demo_dataset()
-    start_key = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-    end_key = end_date.replace(hour=23, minute=59, second=59, microsecond=0)
-    return [item for item in data if start_key <= item['date'] <= end_key]
-
-
+#!/usr/bin/env python3
+"""
+demo_data.py
+
+Generates and serves a large, realistic demo email dataset for the Email Filter
+and Dashboard application. Data is synthesized deterministically for repeatable
+results and covers a broad date range so UI filtering can be exercised.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import List, Dict
+from array import array
+import bisect
+import calendar
+import os
+import pickle
+import random
+import threading
+
+
+# Shared sender table; rows store an index into it instead of carrying their
+# own name/email strings.
+_SENDERS = (
+    ("Himanshu", "himanshu@example.com"),
+    ("Sakher", "sakher@company.com"),
+    ("Mayank", "mayank@techcorp.com"),
+    ("sandhya", "sandhya@startup.io"),
+    ("vinod", "vinod@consulting.com"),
+    ("Priya Nair", "priya.nair@acme.co"),
+    ("aviral", "aviral@supplychain.io"),
+    ("Aisha Khan", "aisha.khan@fintech.app"),
+    ("Nora", "nora@retailhub.com"),
+    ("Lucky", "lucky@hardware.cn"),
+    ("shobhit", "shobhit@healthcare.org"),
+    ("chavi", "chavi@edutech.edu"),
+)
+
+# Struct-of-arrays storage: one parallel list per field, ascending by date.
+# Keeping columns instead of ~3,000 row dicts cuts per-row overhead; dicts are
+# only materialized for the slice a caller actually requests. None is the
+# not-yet-generated sentinel; _GEN_LOCK keeps concurrent first calls (e.g. a
+# UI fetch worker racing a prefetch) from generating the dataset twice.
+_COLUMNS = None
+_GEN_LOCK = threading.Lock()
+_CACHED_DATASET: List[Dict] = []
+
+# Disk cache for the generated columns. The dataset always ends "today", so
+# the cache is keyed by day and regenerated after midnight. The file lives
+# under the user's own cache directory, never the shared temp dir: unpickling
+# a file another local user could pre-create would run their code.
+_CACHE_VERSION = 10
+_CACHE_DIR = (os.environ.get('XDG_CACHE_HOME')
+              or os.path.join(os.path.expanduser('~'), '.cache'))
+_CACHE_FILE = os.path.join(_CACHE_DIR, 'email_filter_demo_dataset.pkl')
+
+
+def _load_columns_from_disk(day_key: str):
+    """Return cached columns for day_key, or None if missing/stale/corrupt."""
+    try:
+        with open(_CACHE_FILE, 'rb') as fh:
+            payload = pickle.load(fh)
+        if payload.get('version') == _CACHE_VERSION and payload.get('day') == day_key:
+            return payload['columns']
+    except Exception:
+        pass
+    return None
+
+
+def _store_columns_to_disk(day_key: str, columns: tuple):
+    """Persist the generated columns; cache failures are non-fatal."""
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(_CACHE_FILE, 'wb') as fh:
+            pickle.dump(
+                {'version': _CACHE_VERSION, 'day': day_key, 'columns': columns},
+                fh, protocol=pickle.HIGHEST_PROTOCOL,
+            )
+    except Exception:
+        pass
+
+
+_SUBJECTS = (
+    "Meeting Reminder",
+    "Project Update",
+    "Invoice Attached",
+    "Release Notes",
+    "Action Required",
+    "Budget Approval",
+    "Welcome Aboard",
+    "Weekly Report",
+    "Customer Feedback",
+    "Outage Postmortem",
+    "Contract Review",
+    "Security Notice",
+)
+
+_BODY_SNIPPETS = (
+    "Please find the details in the attached document. Let me know if you have questions.",
+    "We are on track against the current milestones and expect to hit the deadline.",
+    "This is a reminder for the meeting scheduled tomorrow at 2 PM.",
+    "The latest build includes performance improvements and bug fixes across modules.",
+    "Kindly review and approve at your earliest convenience.",
+    "Thanks for your prompt attention to this matter.",
+    "Summarizing this week\u2019s progress and next steps for the team.",
+    "Please review the notes and provide your feedback by EOD.",
+    "We observed an increase in engagement week over week.",
+    "Action items are listed at the end of this message.",
+)
+
+# Base seed for deterministic output; each day derives its own stream from it
+_BASE_SEED = 12345
+
+
+def _generate_day(day_start: datetime, day_index: int,
+                  body_pool: Dict[tuple, str]) -> list:
+    """Generate one day's rows from a seed derived for that day.
+
+    Each day owns an independent RNG stream, so days can be generated in any
+    order (or split across workers) without changing the output.
+    """
+    rng = random.Random(_BASE_SEED * 1_000_003 + day_index)
+    randrange = rng.randrange
+    emails_today = rng.randint(5, 30)  # denser data
+    # Join each subject with the day label once per day (12 strings)
+    # rather than formatting an f-string for every row; the month table
+    # replaces strftime
+    day_label = '%s %02d, %d' % (calendar.month_abbr[day_start.month],
+                                 day_start.day, day_start.year)
+    day_subjects = [s + ' - ' + day_label for s in _SUBJECTS]
+    day_ts = int(day_start.timestamp())
+    # Local days are not always 86,400 s (DST spring-forward days run
+    # 23 hours), so offsets are bounded by the real gap to the next
+    # midnight; sorting each small offset batch then keeps the whole
+    # buffer ascending by construction, no global sort needed afterwards
+    day_len = int((day_start + timedelta(days=1)).timestamp()) - day_ts
+    offsets = sorted([randrange(day_len) for _ in range(emails_today)])
+    snippets = _BODY_SNIPPETS
+    n_snippets = len(snippets)
+    # One batched draw per field for the whole day instead of per-row
+    # choice/randrange calls
+    choices = rng.choices
+    sender_batch = choices(range(len(_SENDERS)), k=emails_today)
+    subject_batch = choices(day_subjects, k=emails_today)
+    snippet_batch = choices(range(n_snippets), k=3 * emails_today)
+    rows = [None] * emails_today
+    for i, (offset, sender_id, subject) in enumerate(
+            zip(offsets, sender_batch, subject_batch)):
+        key = (snippet_batch[3 * i], snippet_batch[3 * i + 1],
+               snippet_batch[3 * i + 2])
+        body = body_pool.get(key)
+        if body is None:
+            body = ' '.join((snippets[key[0]], snippets[key[1]],
+                             snippets[key[2]]))
+            body_pool[key] = body
+        rows[i] = (sender_id, subject, body, day_ts + offset)
+    return rows
+
+
+def _generate_columns() -> tuple:
+    """Create a large, realistic dataset (~3,000 emails) spanning 180 days.
+
+    Returns parallel (sender_ids, subjects, bodies, dates) columns sorted
+    ascending by date; sender_ids index into _SENDERS and dates are integer
+    epoch seconds rather than boxed datetime objects.
+
+    Days generate independently and could be fanned out across workers, but
+    the whole job runs in single-digit milliseconds once per day (the disk
+    cache covers every other start), so process-pool overhead is not worth
+    paying and generation stays serial.
+    """
+    today = datetime.today().replace(hour=0, minute=0, second=0, microsecond=0)
+    num_days = 180
+    start_range = today - timedelta(days=num_days - 1)
+    one_day = timedelta(days=1)
+
+    # Interning pool: only ~1,000 distinct snippet triples exist across
+    # ~3,000 rows, so repeated combinations share one composed string
+    body_pool: Dict[tuple, str] = {}
+    rows = []
+    for day_index in range(num_days):
+        rows.extend(_generate_day(start_range + day_index * one_day,
+                                  day_index, body_pool))
+
+    # Rows are already ascending by date (days advance and per-day offsets
+    # are sorted); transpose into parallel columns. zip already yields
+    # tuples for the string columns; the numeric date column is packed into
+    # an int64 array, one machine word per row instead of a boxed int.
+    sender_ids, subjects_col, bodies, dates = zip(*rows)
+    return sender_ids, subjects_col, bodies, array('q', dates)
+
+
+def _get_columns() -> tuple:
+    """Return the cached column store, loading from disk or generating it.
+
+    Lazy and thread-safe: the first caller generates (or loads) the columns
+    under a lock while concurrent callers wait, so the work happens once.
+    """
+    global _COLUMNS
+    columns = _COLUMNS
+    if columns is None:
+        with _GEN_LOCK:
+            columns = _COLUMNS
+            if columns is None:
+                day_key = datetime.today().strftime('%Y-%m-%d')
+                columns = _load_columns_from_disk(day_key)
+                if columns is None:
+                    columns = _generate_columns()
+                    _store_columns_to_disk(day_key, columns)
+                _COLUMNS = columns
+    return columns
+
+
+# Shared 50-char body previews. Bodies are interned, so each distinct body
+# is sliced once and every row referencing it reuses the same preview string.
+_PREVIEW_POOL: Dict[str, str] = {}
+
+
+def _body_preview(body: str) -> str:
+    """Return the pooled preview string for an interned body."""
+    preview = _PREVIEW_POOL.get(body)
+    if preview is None:
+        preview = body[:50] + '...' if len(body) > 50 else body
+        _PREVIEW_POOL[body] = preview
+    return preview
+
+
+def _materialize(lo: int, hi: int) -> List[Dict]:
+    """Build row dicts for the half-open column range [lo, hi), latest first."""
+    sender_ids, subjects, bodies, dates = _get_columns()
+    senders = _SENDERS
+    from_ts = datetime.fromtimestamp
+    preview = _body_preview
+    rows = [
+        {'name': senders[sid][0], 'email': senders[sid][1], 'subject': subject,
+         'body': body, 'preview': preview(body), 'date': from_ts(ts)}
+        for sid, subject, body, ts in zip(
+            sender_ids[lo:hi], subjects[lo:hi], bodies[lo:hi], dates[lo:hi])
+    ]
+    rows.reverse()
+    return rows
+
+
+def get_demo_dataset() -> List[Dict]:
+    """Return the full dataset as row dicts (latest first), cached."""
+    global _CACHED_DATASET
+    if not _CACHED_DATASET:
+        _CACHED_DATASET = _materialize(0, len(_get_columns()[3]))
+    return _CACHED_DATASET
+
+
+# Memo of recently materialized range queries. The UI re-runs the same
+# (start, end) pair on refreshes and quick-select toggles, so repeats are
+# served from here instead of rebuilding the row dicts.
+_QUERY_CACHE: Dict[tuple, List[Dict]] = {}
+_QUERY_CACHE_MAX = 16
+
+
+def load_demo_emails_between(start_date: datetime, end_date: datetime) -> List[Dict]:
+    """Filter the large dataset between start_date and end_date (inclusive).
+
+    The date column is sorted, so the range boundaries are located with a
+    binary search and only the matching slice is materialized (latest first).
+    Repeated queries for the same range return the memoized list itself, so
+    callers should copy before reordering or truncating it.
+    """
+    dates = _get_columns()[3]
+    start_key = int(start_date.replace(hour=0, minute=0, second=0,
+                                       microsecond=0).timestamp())
+    end_key = int(end_date.replace(hour=23, minute=59, second=59,
+                                   microsecond=0).timestamp())
+    key = (start_key, end_key)
+    cached = _QUERY_CACHE.get(key)
+    if cached is None:
+        lo = bisect.bisect_left(dates, start_key)
+        hi = bisect.bisect_right(dates, end_key)
+        cached = _materialize(lo, hi)
+        if len(_QUERY_CACHE) >= _QUERY_CACHE_MAX:
+            # Drop the oldest entry (insertion order) to bound memory
+            _QUERY_CACHE.pop(next(iter(_QUERY_CACHE)))
+        _QUERY_CACHE[key] = cached
+    return cached
+
+